@@ -7,7 +7,12 @@ from pathlib import Path
 import click
 
 from .importer import _load_imported_zh_mappings
-from .io import _build_target_path, _encode_translations, _load_translation_file
+from .io import (
+    _build_target_path,
+    _discover_language_files,
+    _encode_translations,
+    _load_translation_file,
+)
 from .lang_parser import parse_mods_directory
 from .models import DEFAULT_TARGET_LOCALES, JarParseError
 from .sync import (
@@ -21,6 +26,19 @@ _EN_LOCALE = "en_us"
 _ZH_LOCALE = "zh_cn"
 
 
+def _echo_counters(counters: dict[str, int]) -> None:
+    """Print command summary counters with one output call.
+
+    Args:
+        counters: Ordered mapping of counter name to value.
+
+    Returns:
+        None.
+    """
+
+    click.echo("\n".join(f"{name}={value}" for name, value in counters.items()))
+
+
 @click.group(help="Utilities for MC language extraction and import.")
 def main() -> None:
     """Root command group for uplang.
@@ -94,8 +112,12 @@ def init_command(mods_dir: Path, assets_dir: Path, workers: int | None) -> None:
             destination.write_bytes(_encode_translations(language_file.translations))
             written_files += 1
 
-    click.echo(f"written_files={written_files}")
-    click.echo(f"failed_files={failed_files}")
+    _echo_counters(
+        {
+            "written_files": written_files,
+            "failed_files": failed_files,
+        }
+    )
 
 
 @main.command(
@@ -167,17 +189,14 @@ def update_command(mods_dir: Path, assets_dir: Path, workers: int | None) -> Non
         en_path = _build_target_path(assets_dir, mod_id, _EN_LOCALE)
         zh_path = _build_target_path(assets_dir, mod_id, _ZH_LOCALE)
 
-        previous_en_translations = (
-            _load_translation_file(en_path) if en_path.exists() else {}
-        )
-        current_zh_translations = (
-            _load_translation_file(zh_path) if zh_path.exists() else {}
-        )
+        previous_en_translations = _load_translation_file(en_path, missing_ok=True)
+        current_zh_translations = _load_translation_file(zh_path, missing_ok=True)
 
-        added_keys, deleted_keys, changed_keys = _calculate_en_translation_diff(
+        en_diff = _calculate_en_translation_diff(
             previous_en_translations,
             latest_en_translations,
         )
+        added_keys, deleted_keys, changed_keys = en_diff
         if len(added_keys) == 0 and len(deleted_keys) == 0 and len(changed_keys) == 0:
             continue
 
@@ -196,17 +215,23 @@ def update_command(mods_dir: Path, assets_dir: Path, workers: int | None) -> Non
             latest_en_translations,
             current_zh_translations,
             latest_zh_translations,
+            en_diff=en_diff,
         )
         zh_changes_total += zh_changes
-        zh_path.write_bytes(_encode_translations(synced_zh_translations))
-
-    click.echo(f"scanned_mods={scanned_mods}")
-    click.echo(f"updated_mods={updated_mods}")
-    click.echo(f"added_keys={added_keys_total}")
-    click.echo(f"deleted_keys={deleted_keys_total}")
-    click.echo(f"changed_keys={changed_keys_total}")
-    click.echo(f"zh_changes={zh_changes_total}")
-    click.echo(f"failed_files={failed_files}")
+        if zh_changes > 0 or len(current_zh_translations) == 0:
+            zh_path.write_bytes(_encode_translations(synced_zh_translations))
+
+    _echo_counters(
+        {
+            "scanned_mods": scanned_mods,
+            "updated_mods": updated_mods,
+            "added_keys": added_keys_total,
+            "deleted_keys": deleted_keys_total,
+            "changed_keys": changed_keys_total,
+            "zh_changes": zh_changes_total,
+            "failed_files": failed_files,
+        }
+    )
 
 
 @main.command(
@@ -246,10 +271,7 @@ def import_command(assets_dir: Path, import_source: Path) -> None:
     updated_mods = 0
     replaced_entries = 0
 
-    target_language_files = sorted(
-        assets_dir.glob("*/lang/zh_cn.json"),
-        key=lambda path: path.as_posix().lower(),
-    )
+    target_language_files = _discover_language_files(assets_dir, _ZH_LOCALE)
     target_mod_ids = {path.parent.parent.name for path in target_language_files}
     imported_mappings = _load_imported_zh_mappings(import_source, target_mod_ids)
 
@@ -258,13 +280,14 @@ def import_command(assets_dir: Path, import_source: Path) -> None:
         scanned_mods += 1
 
         imported_zh_translations = imported_mappings.get(mod_id)
-        if imported_zh_translations is None:
+        if not imported_zh_translations:
             continue
 
         current_en_path = assets_dir / mod_id / "lang" / "en_us.json"
         current_zh_translations = _load_translation_file(target_zh_path)
-        current_en_translations = (
-            _load_translation_file(current_en_path) if current_en_path.exists() else {}
+        current_en_translations = _load_translation_file(
+            current_en_path,
+            missing_ok=True,
         )
 
         merged_translations, replaced_count = _merge_imported_translations_for_mod(
@@ -279,9 +302,13 @@ def import_command(assets_dir: Path, import_source: Path) -> None:
         updated_mods += 1
         replaced_entries += replaced_count
 
-    click.echo(f"scanned_mods={scanned_mods}")
-    click.echo(f"updated_mods={updated_mods}")
-    click.echo(f"replaced_entries={replaced_entries}")
+    _echo_counters(
+        {
+            "scanned_mods": scanned_mods,
+            "updated_mods": updated_mods,
+            "replaced_entries": replaced_entries,
+        }
+    )
 
 
 if __name__ == "__main__":
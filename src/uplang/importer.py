@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import re
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
 from pathlib import Path
 from zipfile import BadZipFile, ZipFile
 
@@ -31,15 +33,32 @@ def _load_imported_zh_from_directory(
 
     Returns:
         Mapping from mod id to imported zh_cn translation mapping.
+        Mods without an imported zh_cn file map to an empty mapping.
     """
 
-    imported_mappings: dict[str, dict[str, str]] = {}
-    for mod_id in target_mod_ids:
-        imported_zh_path = import_assets_dir / mod_id / "lang" / "zh_cn.json"
-        if not imported_zh_path.exists():
-            continue
-        imported_mappings[mod_id] = _load_translation_file(imported_zh_path)
-    return imported_mappings
+    mod_ids = sorted(target_mod_ids)
+    if len(mod_ids) == 0:
+        return {}
+
+    imported_zh_paths = [
+        import_assets_dir / mod_id / "lang" / f"{_ZH_LOCALE}.json"
+        for mod_id in mod_ids
+    ]
+    if len(mod_ids) == 1:
+        return {
+            mod_ids[0]: _load_translation_file(imported_zh_paths[0], missing_ok=True)
+        }
+
+    with ThreadPoolExecutor() as executor:
+        loaded_mappings = list(
+            executor.map(
+                _load_translation_file,
+                imported_zh_paths,
+                repeat(True, len(mod_ids)),
+            )
+        )
+
+    return dict(zip(mod_ids, loaded_mappings, strict=True))
 
 
 def _load_imported_zh_from_zip(
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import os
+import re
 from pathlib import Path
 
 import click
@@ -14,6 +16,10 @@ from .utils import (
     _sanitize_translations,
 )
 
+_ESCAPE_CANDIDATE_PATTERN = re.compile(
+    rb"\xee|\xef[\x80-\xa3]|\xf3[\xb0-\xbf]|\xf4[\x80-\x8f]|__UPLANG_SURR_"
+)
+
 
 def _build_target_path(assets_dir: Path, mod_id: str, locale: str) -> Path:
     """Build the destination language file path.
@@ -30,6 +36,29 @@ def _build_target_path(assets_dir: Path, mod_id: str, locale: str) -> Path:
     return assets_dir / mod_id / "lang" / f"{locale}.json"
 
 
+def _discover_language_files(assets_dir: Path, locale: str) -> list[Path]:
+    """Find one locale's language files for every mod in an assets directory.
+
+    Args:
+        assets_dir: Assets directory in the resource pack.
+        locale: Locale name of the language files to find.
+
+    Returns:
+        Language file paths sorted case-insensitively by path.
+    """
+
+    file_name = f"{locale}.json"
+    language_files: list[Path] = []
+    with os.scandir(assets_dir) as entries:
+        for entry in entries:
+            if not entry.is_dir():
+                continue
+            language_file_path = os.path.join(entry.path, "lang", file_name)
+            if os.path.isfile(language_file_path):
+                language_files.append(Path(language_file_path))
+    return sorted(language_files, key=lambda path: path.as_posix().lower())
+
+
 def _encode_translations(translations: dict[str, str]) -> bytes:
     """Encode translations to JSON bytes.
 
@@ -42,16 +71,22 @@ def _encode_translations(translations: dict[str, str]) -> bytes:
 
     sanitized = _sanitize_translations(translations)
     encoded = orjson.dumps(sanitized, option=orjson.OPT_INDENT_2)
+    if _ESCAPE_CANDIDATE_PATTERN.search(encoded) is None:
+        return encoded
     escaped = _escape_private_use_characters(encoded.decode("utf-8"))
     escaped = _restore_surrogate_escape_tokens(escaped)
     return escaped.encode("utf-8")
 
 
-def _load_translation_file(language_file_path: Path) -> dict[str, str]:
+def _load_translation_file(
+    language_file_path: Path,
+    missing_ok: bool = False,
+) -> dict[str, str]:
     """Load one language JSON file as a translation mapping.
 
     Args:
         language_file_path: Language JSON file path.
+        missing_ok: Return an empty mapping when the file does not exist.
 
     Returns:
         Parsed translation mapping.
@@ -63,6 +98,8 @@ def _load_translation_file(language_file_path: Path) -> dict[str, str]:
     try:
         content = language_file_path.read_bytes()
     except OSError as exc:
+        if missing_ok and isinstance(exc, FileNotFoundError):
+            return {}
         raise click.ClickException(
             f"Failed to read language file: {language_file_path}"
         ) from exc
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import codecs
 import json
 import re
 from typing import Any, cast
@@ -19,70 +20,65 @@ FALLBACK_JSON_ENCODINGS: tuple[str, ...] = (
     "gb18030",
     "cp1252",
 )
+BOM_JSON_ENCODINGS: tuple[tuple[bytes, str], ...] = (
+    (codecs.BOM_UTF32_LE, "utf-32"),
+    (codecs.BOM_UTF32_BE, "utf-32"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
 
+_JSON_KEY_PATTERN = re.compile(r'"[^"]*"\s*:')
+_TRAILING_COMMA_PATTERN = re.compile(r",\s*([}\]])")
+_JSON_COMMENT_PATTERN = re.compile(
+    r'(?P<string>"[^"\\]*(?:\\.[^"\\]*)*(?:"|\\?\Z))'
+    r"|//[^\r\n]*"
+    r"|(?P<indent>(?:\A|(?<=[\r\n]))[ \t]*)#[^\r\n]*",
+    flags=re.DOTALL,
+)
 
-def _remove_json_comments(text: str) -> str:
-    """Remove JSON-like comments from text while preserving strings.
+
+def _detect_bom_encoding(content: bytes) -> str | None:
+    """Detect the text encoding declared by a leading byte order mark.
 
     Args:
-        text: Source text that may contain comments.
+        content: Raw language file bytes.
 
     Returns:
-        Text without comment segments.
+        Encoding name for the detected byte order mark, otherwise None.
     """
 
-    result: list[str] = []
-    in_string = False
-    escaped = False
-    only_whitespace_since_newline = True
-    index = 0
+    for bom, encoding in BOM_JSON_ENCODINGS:
+        if content.startswith(bom):
+            return encoding
+    return None
 
-    while index < len(text):
-        char = text[index]
-        next_char = text[index + 1] if index + 1 < len(text) else ""
 
-        if in_string:
-            result.append(char)
-            if escaped:
-                escaped = False
-            elif char == "\\":
-                escaped = True
-            elif char == '"':
-                in_string = False
-            if char in "\r\n":
-                only_whitespace_since_newline = True
-            index += 1
-            continue
+def _replace_json_comment(match: re.Match[str]) -> str:
+    """Keep string literals and indentation while dropping one comment match.
 
-        if char == '"':
-            in_string = True
-            only_whitespace_since_newline = False
-            result.append(char)
-            index += 1
-            continue
+    Args:
+        match: Regex match for a string literal or a comment segment.
 
-        if char == "/" and next_char == "/":
-            index += 2
-            while index < len(text) and text[index] not in "\r\n":
-                index += 1
-            continue
+    Returns:
+        The string literal, the indentation before a line comment, or "".
+    """
 
-        if char == "#" and only_whitespace_since_newline:
-            index += 1
-            while index < len(text) and text[index] not in "\r\n":
-                index += 1
-            continue
+    return match.group("string") or match.group("indent") or ""
 
-        result.append(char)
-        if char in "\r\n":
-            only_whitespace_since_newline = True
-        elif char in " \t":
-            pass
-        else:
-            only_whitespace_since_newline = False
-        index += 1
 
-    return "".join(result)
+def _remove_json_comments(text: str) -> str:
+    """Remove JSON-like comments from text while preserving strings.
+
+    Args:
+        text: Source text that may contain comments.
+
+    Returns:
+        Text without comment segments.
+    """
+
+    if "//" not in text and "#" not in text:
+        return text
+    return _JSON_COMMENT_PATTERN.sub(_replace_json_comment, text)
 
 
 def _wrap_json_object_if_needed(text: str) -> str:
@@ -100,7 +96,7 @@ def _wrap_json_object_if_needed(text: str) -> str:
         return text
     if stripped.startswith("{") or stripped.startswith("["):
         return text
-    if not re.search(r'"[^"]*"\s*:', stripped):
+    if _JSON_KEY_PATTERN.search(stripped) is None:
         return text
     return "{\n" + stripped + "\n}"
 
@@ -115,7 +111,7 @@ def _strip_trailing_commas(text: str) -> str:
         Text without trailing commas before closing delimiters.
     """
 
-    return re.sub(r",\s*([}\]])", r"\1", text)
+    return _TRAILING_COMMA_PATTERN.sub(r"\1", text)
 
 
 def _extract_first_json_root(text: str) -> str:
@@ -257,7 +253,11 @@ def _tolerant_json_decode(content: bytes) -> dict[str, str]:
     """
 
     decode_candidates: list[str] = ["utf-8", *FALLBACK_JSON_ENCODINGS, "latin-1"]
+    bom_encoding = _detect_bom_encoding(content)
+    if bom_encoding is not None:
+        decode_candidates.insert(0, bom_encoding)
     seen_encodings: set[str] = set()
+    attempted_texts: set[str] = set()
 
     for encoding in decode_candidates:
         if encoding in seen_encodings:
@@ -270,6 +270,10 @@ def _tolerant_json_decode(content: bytes) -> dict[str, str]:
 
         normalized = text.lstrip("\ufeff")
         normalized = normalized.replace("\x00", "")
+        if normalized in attempted_texts:
+            continue
+        attempted_texts.add(normalized)
+
         normalized = _remove_json_comments(normalized)
         normalized = _wrap_json_object_if_needed(normalized)
         normalized = _strip_trailing_commas(normalized)
@@ -307,6 +311,7 @@ def parse_language_json(content: bytes) -> dict[str, str]:
         ValueError: If decoding fails after compatibility strategies.
     """
 
+    content = content.removeprefix(codecs.BOM_UTF8)
     try:
         parsed = orjson.loads(content)
     except orjson.JSONDecodeError:
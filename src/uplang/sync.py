@@ -43,8 +43,11 @@ def _calculate_en_translation_diff(
         Tuple containing added, deleted, and changed key sets.
     """
 
-    previous_keys = set(previous_translations.keys())
-    latest_keys = set(latest_translations.keys())
+    if previous_translations == latest_translations:
+        return set(), set(), set()
+
+    previous_keys = previous_translations.keys()
+    latest_keys = latest_translations.keys()
 
     added_keys = latest_keys - previous_keys
     deleted_keys = previous_keys - latest_keys
@@ -62,6 +65,7 @@ def _sync_zh_translations_for_en_update(
     latest_en_translations: dict[str, str],
     current_zh_translations: dict[str, str],
     latest_zh_translations: dict[str, str],
+    en_diff: tuple[set[str], set[str], set[str]] | None = None,
 ) -> tuple[dict[str, str], int]:
     """Sync zh_cn keys and untranslated values using English key diffs.
 
@@ -70,46 +74,52 @@ def _sync_zh_translations_for_en_update(
         latest_en_translations: Latest en_us mapping parsed from mods.
         current_zh_translations: Existing zh_cn mapping in resource pack.
         latest_zh_translations: Latest zh_cn mapping parsed from mods.
+        en_diff: Optional precomputed added, deleted, and changed key sets.
+            None means the diff is calculated from the en_us mappings.
 
     Returns:
-        Updated zh_cn mapping and number of changed entries.
+        Updated zh_cn mapping and number of changed entries. The current
+        mapping itself is returned when the en_us diff is empty.
     """
 
+    if en_diff is None:
+        en_diff = _calculate_en_translation_diff(
+            previous_en_translations,
+            latest_en_translations,
+        )
+    added_keys, deleted_keys, changed_keys = en_diff
+    if len(added_keys) == 0 and len(deleted_keys) == 0 and len(changed_keys) == 0:
+        return current_zh_translations, 0
+
     merged_translations = dict(current_zh_translations)
     merged_changes = 0
-    added_keys, deleted_keys, changed_keys = _calculate_en_translation_diff(
-        previous_en_translations,
-        latest_en_translations,
-    )
-
-    for key in deleted_keys:
-        if key in merged_translations:
-            del merged_translations[key]
-            merged_changes += 1
 
-    for key in changed_keys:
-        fallback_value = latest_zh_translations.get(key, latest_en_translations[key])
-        existing_value = merged_translations.get(key)
+    latest_zh_get = latest_zh_translations.get
+    previous_en_get = previous_en_translations.get
 
-        if existing_value is None:
-            merged_translations[key] = fallback_value
-            merged_changes += 1
-            continue
+    deleted_present_keys = deleted_keys & merged_translations.keys()
+    for key in deleted_present_keys:
+        del merged_translations[key]
+    merged_changes += len(deleted_present_keys)
 
-        previous_english = previous_en_translations.get(key)
-        if _is_untranslated_value(
+    for key in changed_keys & merged_translations.keys():
+        existing_value = merged_translations[key]
+        fallback_value = latest_zh_get(key, latest_en_translations[key])
+        if existing_value != fallback_value and _is_untranslated_value(
             existing_value,
-            previous_english,
-        ) and existing_value != fallback_value:
+            previous_en_get(key),
+        ):
             merged_translations[key] = fallback_value
             merged_changes += 1
 
-    for key in added_keys:
-        if key in merged_translations:
-            continue
-        fallback_value = latest_zh_translations.get(key, latest_en_translations[key])
-        merged_translations[key] = fallback_value
-        merged_changes += 1
+    missing_keys = (added_keys | changed_keys) - merged_translations.keys()
+    if len(missing_keys) > 0:
+        merged_translations.update(
+            (key, latest_zh_get(key, english_value))
+            for key, english_value in latest_en_translations.items()
+            if key in missing_keys
+        )
+        merged_changes += len(missing_keys)
 
     return merged_translations, merged_changes
 
@@ -127,22 +137,27 @@ def _merge_imported_translations_for_mod(
         imported_zh_translations: Imported pack zh_cn entries.
 
     Returns:
-        Updated zh_cn mapping and number of replaced entries.
+        Updated zh_cn mapping and number of replaced entries. The current
+        mapping itself is returned when no entry is replaced.
     """
 
-    merged_translations = dict(current_zh_translations)
-    replaced_entries = 0
+    replacements: dict[str, str] = {}
+
+    for key in current_zh_translations.keys() & imported_zh_translations.keys():
+        current_value = current_zh_translations[key]
+        imported_value = imported_zh_translations[key]
+        if imported_value == current_value:
+            continue
 
-    for key, current_value in current_zh_translations.items():
         english_reference = current_en_translations.get(key)
         if not _is_untranslated_value(current_value, english_reference):
             continue
 
-        imported_value = imported_zh_translations.get(key)
-        if imported_value is None or imported_value == current_value:
-            continue
+        replacements[key] = imported_value
 
-        merged_translations[key] = imported_value
-        replaced_entries += 1
+    if len(replacements) == 0:
+        return current_zh_translations, 0
 
-    return merged_translations, replaced_entries
+    merged_translations = dict(current_zh_translations)
+    merged_translations.update(replacements)
+    return merged_translations, len(replacements)
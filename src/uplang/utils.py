@@ -5,10 +5,27 @@ from __future__ import annotations
 import re
 
 _SURROGATE_TOKEN_PATTERN = re.compile(r"__UPLANG_SURR_([0-9A-F]{4})__")
+_SURROGATE_CHARACTER_PATTERN = re.compile(r"[\ud800-\udfff]")
+_PRIVATE_USE_CHARACTER_PATTERN = re.compile(
+    r"[\uE000-\uF8FF\U000F0000-\U000FFFFD\U00100000-\U0010FFFD]"
+)
 _CJK_CHARACTER_PATTERN = re.compile(r"[\u3400-\u4DBF\u4E00-\u9FFF\uF900-\uFAFF]")
 _ASCII_LETTER_PATTERN = re.compile(r"[A-Za-z]")
 
 
+def _format_surrogate_token(match: re.Match[str]) -> str:
+    """Format one matched surrogate code point as a token placeholder.
+
+    Args:
+        match: Regex match containing one surrogate code point.
+
+    Returns:
+        Reversible token placeholder for the surrogate code point.
+    """
+
+    return f"__UPLANG_SURR_{ord(match.group()):04X}__"
+
+
 def _sanitize_utf8_string(value: str) -> str:
     """Replace surrogate code points with reversible token placeholders.
 
@@ -19,14 +36,9 @@ def _sanitize_utf8_string(value: str) -> str:
         UTF-8 safe string without surrogate code points.
     """
 
-    chunks: list[str] = []
-    for character in value:
-        codepoint = ord(character)
-        if 0xD800 <= codepoint <= 0xDFFF:
-            chunks.append(f"__UPLANG_SURR_{codepoint:04X}__")
-        else:
-            chunks.append(character)
-    return "".join(chunks)
+    if value.isascii():
+        return value
+    return _SURROGATE_CHARACTER_PATTERN.sub(_format_surrogate_token, value)
 
 
 def _sanitize_translations(translations: dict[str, str]) -> dict[str, str]:
@@ -45,23 +57,6 @@ def _sanitize_translations(translations: dict[str, str]) -> dict[str, str]:
     }
 
 
-def _is_private_use_codepoint(codepoint: int) -> bool:
-    """Check whether codepoint is in Unicode private-use ranges.
-
-    Args:
-        codepoint: Unicode codepoint integer value.
-
-    Returns:
-        True when codepoint is private-use, otherwise False.
-    """
-
-    return (
-        0xE000 <= codepoint <= 0xF8FF
-        or 0xF0000 <= codepoint <= 0xFFFFD
-        or 0x100000 <= codepoint <= 0x10FFFD
-    )
-
-
 def _escape_codepoint_as_json_unicode(codepoint: int) -> str:
     """Escape one codepoint using JSON-compatible unicode escapes.
 
@@ -80,6 +75,19 @@ def _escape_codepoint_as_json_unicode(codepoint: int) -> str:
     return f"\\u{high:04X}\\u{low:04X}"
 
 
+def _format_private_use_escape(match: re.Match[str]) -> str:
+    """Format one matched private-use character as a unicode escape.
+
+    Args:
+        match: Regex match containing one private-use character.
+
+    Returns:
+        JSON unicode escape sequence for the character.
+    """
+
+    return _escape_codepoint_as_json_unicode(ord(match.group()))
+
+
 def _escape_private_use_characters(text: str) -> str:
     """Escape private-use characters as unicode escape sequences.
 
@@ -90,14 +98,7 @@ def _escape_private_use_characters(text: str) -> str:
         JSON text where private-use characters are represented as escapes.
     """
 
-    chunks: list[str] = []
-    for character in text:
-        codepoint = ord(character)
-        if _is_private_use_codepoint(codepoint):
-            chunks.append(_escape_codepoint_as_json_unicode(codepoint))
-        else:
-            chunks.append(character)
-    return "".join(chunks)
+    return _PRIVATE_USE_CHARACTER_PATTERN.sub(_format_private_use_escape, text)
 
 
 def _restore_surrogate_escape_tokens(text: str) -> str: